@@ -2,21 +2,49 @@ from __future__ import annotations
 
 import sqlite3
 from datetime import datetime, timezone, timedelta
-from typing import Iterable
+from typing import Iterable, Set
 
+# Bump when SCHEMA changes in a way _migrate() has to handle for old files.
+# v1: emailed_leads / seen_companies rebuilt WITHOUT ROWID, timestamp indexes.
+SCHEMA_VERSION = 1
+
+# Both tables are stored WITHOUT ROWID: the primary key IS the b-tree,
+# so a lookup by company number is one search instead of two.
 SCHEMA = """
 CREATE TABLE IF NOT EXISTS emailed_leads (
   company_number TEXT PRIMARY KEY,
   company_name   TEXT,
   emailed_at     TEXT
-);
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_emailed_leads_emailed_at ON emailed_leads(emailed_at);
 
 CREATE TABLE IF NOT EXISTS seen_companies (
   company_number TEXT PRIMARY KEY,
   seen_at        TEXT
-);
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_seen_companies_seen_at ON seen_companies(seen_at);
 """
 
+# Tables that pre-v1 cache files created as ordinary rowid tables
+WITHOUT_ROWID_TABLES = ("emailed_leads", "seen_companies")
+
+# Connection tuning: WAL with synchronous=NORMAL (fsync at checkpoints, not
+# every commit — safe in WAL mode, at worst the last commit is lost on power
+# failure), keep temp b-trees in RAM, give SQLite a ~20 MB page cache and
+# memory-map the file so hot lookups skip read() syscalls.
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL;",
+    "PRAGMA synchronous=NORMAL;",
+    "PRAGMA temp_store=MEMORY;",
+    "PRAGMA cache_size=-20000;",
+    "PRAGMA mmap_size=268435456;",
+)
+
+# Host parameters per "IN (...)" probe; older SQLite builds cap them at 999.
+IN_BATCH = 500
+
 # A company we have already emailed stays out of the pool for 180 days.
 # After that it re-enters — circumstances may have changed.
 EMAILED_TTL_DAYS = 180
@@ -30,33 +58,67 @@ class LeadCache:
     def __init__(self, path: str):
         self.path = path
         self._conn = sqlite3.connect(self.path)
-        self._conn.execute("PRAGMA journal_mode=WAL;")
-        for stmt in SCHEMA.strip().split(";"):
-            stmt = stmt.strip()
-            if stmt:
-                self._conn.execute(stmt)
-        self._conn.commit()
+        for pragma in PRAGMAS:
+            self._conn.execute(pragma)
+        self._migrate()
         self._prune()
 
+    def _migrate(self) -> None:
+        """Create the schema, rebuilding tables from older cache files."""
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= SCHEMA_VERSION:
+            return
+
+        existing = {
+            row[0] for row in self._conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        }
+        legacy = [t for t in WITHOUT_ROWID_TABLES if t in existing]
+
+        with self._conn:
+            self._conn.execute("BEGIN")
+            for table in legacy:
+                self._conn.execute(f"ALTER TABLE {table} RENAME TO {table}_v0")
+            for stmt in SCHEMA.strip().split(";"):
+                stmt = stmt.strip()
+                if stmt:
+                    self._conn.execute(stmt)
+            for table in legacy:
+                self._conn.execute(f"INSERT OR IGNORE INTO {table} SELECT * FROM {table}_v0")
+                self._conn.execute(f"DROP TABLE {table}_v0")
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
     def _prune(self) -> None:
         """Remove stale entries from both tables on startup."""
         now = datetime.now(timezone.utc)
 
         emailed_cutoff = (now - timedelta(days=EMAILED_TTL_DAYS)).isoformat()
-        self._conn.execute(
-            "DELETE FROM emailed_leads WHERE emailed_at < ?", (emailed_cutoff,)
-        )
-
         seen_cutoff = (now - timedelta(days=SEEN_TTL_DAYS)).isoformat()
-        self._conn.execute(
-            "DELETE FROM seen_companies WHERE seen_at < ?", (seen_cutoff,)
-        )
 
-        self._conn.commit()
+        # One transaction (one WAL commit) for both deletes
+        with self._conn:
+            self._conn.execute(
+                "DELETE FROM emailed_leads WHERE emailed_at < ?", (emailed_cutoff,)
+            )
+            self._conn.execute(
+                "DELETE FROM seen_companies WHERE seen_at < ?", (seen_cutoff,)
+            )
 
     def close(self) -> None:
         self._conn.close()
 
+    def _present(self, table: str, company_numbers: Iterable[str]) -> Set[str]:
+        """The subset of company_numbers that has a row in table."""
+        numbers = list(company_numbers)
+        found: Set[str] = set()
+        for i in range(0, len(numbers), IN_BATCH):
+            chunk = numbers[i : i + IN_BATCH]
+            marks = ",".join("?" * len(chunk))
+            cur = self._conn.execute(
+                f"SELECT company_number FROM {table} WHERE company_number IN ({marks})", chunk
+            )
+            found.update(row[0] for row in cur)
+        return found
+
     # ------------------------------------------------------------------ #
     # emailed_leads — companies we have already sent to Rushi             #
     # ------------------------------------------------------------------ #
@@ -68,14 +130,23 @@ class LeadCache:
         )
         return cur.fetchone() is not None
 
+    def emailed_among(self, company_numbers: Iterable[str]) -> Set[str]:
+        """Batch form of was_emailed(): one query per IN_BATCH numbers."""
+        return self._present("emailed_leads", company_numbers)
+
     def add_emailed(self, items: Iterable[tuple[str, str]]) -> None:
         now = datetime.now(timezone.utc).isoformat()
         rows = [(cn, name, now) for cn, name in items]
-        self._conn.executemany(
-            "INSERT OR REPLACE INTO emailed_leads(company_number, company_name, emailed_at) VALUES (?,?,?)",
-            rows,
-        )
-        self._conn.commit()
+        with self._conn:
+            # Upsert in place (REPLACE would delete + re-insert the row) and
+            # keep a previously stored name if this one is blank.
+            self._conn.executemany(
+                "INSERT INTO emailed_leads(company_number, company_name, emailed_at) VALUES (?,?,?) "
+                "ON CONFLICT(company_number) DO UPDATE SET "
+                "company_name = COALESCE(NULLIF(excluded.company_name, ''), emailed_leads.company_name), "
+                "emailed_at = excluded.emailed_at",
+                rows,
+            )
 
     # ------------------------------------------------------------------ #
     # seen_companies — every company number we have ever evaluated        #
@@ -88,14 +159,18 @@ class LeadCache:
         )
         return cur.fetchone() is not None
 
+    def seen_among(self, company_numbers: Iterable[str]) -> Set[str]:
+        """Batch form of was_seen(): one query per IN_BATCH numbers."""
+        return self._present("seen_companies", company_numbers)
+
     def mark_seen(self, company_numbers: Iterable[str]) -> None:
         now = datetime.now(timezone.utc).isoformat()
         rows = [(cn, now) for cn in company_numbers]
-        self._conn.executemany(
-            "INSERT OR IGNORE INTO seen_companies(company_number, seen_at) VALUES (?,?)",
-            rows,
-        )
-        self._conn.commit()
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO seen_companies(company_number, seen_at) VALUES (?,?)",
+                rows,
+            )
 
     # ------------------------------------------------------------------ #
     # Legacy shim — keeps any code that still calls .has() working        #
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
-from typing import List
+from functools import lru_cache
+from typing import Tuple
 
 
 def _env(name: str, default: str | None = None) -> str:
@@ -30,7 +31,7 @@ class Config:
     smtp_user: str
     smtp_pass: str
     email_from: str
-    email_to: List[str]
+    email_to: Tuple[str, ...]
 
     sponsor_register_url: str | None
 
@@ -40,10 +41,19 @@ class Config:
     advanced_page_size: int
     max_pages_per_sic: int
 
+    ch_workers: int
+    ch_retries: int
 
+    target_qualified_pool: int
+    max_eval_candidates: int
+    max_seeded_candidates: int
+
+
+@lru_cache(maxsize=1)
 def load_config() -> Config:
+    """Read the environment once per process; later calls share the instance."""
     email_to_raw = _env("EMAIL_TO")
-    email_to = [x.strip() for x in email_to_raw.split(",") if x.strip()]
+    email_to = tuple(x.strip() for x in email_to_raw.split(",") if x.strip())
 
     return Config(
         companies_house_api_key=_env("COMPANIES_HOUSE_API_KEY"),
@@ -58,4 +68,9 @@ def load_config() -> Config:
         max_leads=_env_int("MAX_LEADS", 50),
         advanced_page_size=_env_int("ADVANCED_PAGE_SIZE", 200),
         max_pages_per_sic=_env_int("MAX_PAGES_PER_SIC", 10),
+        ch_workers=_env_int("CH_WORKERS", 8),
+        ch_retries=_env_int("CH_RETRY_COUNT", 3),
+        target_qualified_pool=_env_int("TARGET_QUALIFIED_POOL", 120),
+        max_eval_candidates=_env_int("MAX_EVAL_CANDIDATES", 600),
+        max_seeded_candidates=_env_int("MAX_SEEDED_CANDIDATES", 2000),
     )
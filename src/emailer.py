@@ -1,9 +1,8 @@
 from __future__ import annotations
 
 import smtplib
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from typing import List
+from email.message import EmailMessage
+from typing import Sequence
 
 def send_html_email(
     *,
@@ -12,20 +11,21 @@ def send_html_email(
     smtp_user: str,
     smtp_pass: str,
     from_addr: str,
-    to_addrs: List[str],
+    to_addrs: Sequence[str],
     subject: str,
     html_body: str,
 ) -> None:
-    msg = MIMEMultipart("alternative")
+    msg = EmailMessage()
     msg["Subject"] = subject
     msg["From"] = from_addr
     msg["To"] = ", ".join(to_addrs)
 
     plain = "This email contains an HTML report. Please view in an email client that supports HTML."
-    msg.attach(MIMEText(plain, "plain", "utf-8"))
-    msg.attach(MIMEText(html_body, "html", "utf-8"))
+    msg.set_content(plain)
+    msg.add_alternative(html_body, subtype="html")
 
+    # send_message flattens straight to bytes — no intermediate as_string() copy
     with smtplib.SMTP(smtp_host, smtp_port) as server:
         server.starttls()
         server.login(smtp_user, smtp_pass)
-        server.sendmail(from_addr, to_addrs, msg.as_string())
+        server.send_message(msg, from_addr=from_addr, to_addrs=list(to_addrs))
@@ -7,9 +7,10 @@ from .normalize import norm_text
 
 UK_POSTCODE_RE = re.compile(r"^[A-Z]{1,2}\d[A-Z\d]?\s*\d[A-Z]{2}$", re.I)
 
-SCOTLAND_PREFIXES = ("AB","DD","DG","EH","FK","G","HS","IV","KA","KW","KY","ML","PA","PH","TD","ZE")
-WALES_PREFIXES = ("CF","LD","LL","NP","SA")
-NI_PREFIXES = ("BT",)
+# Only ever probed for membership, so hashed rather than scanned
+SCOTLAND_PREFIXES = frozenset({"AB","DD","DG","EH","FK","G","HS","IV","KA","KW","KY","ML","PA","PH","TD","ZE"})
+WALES_PREFIXES = frozenset({"CF","LD","LL","NP","SA"})
+NI_PREFIXES = frozenset({"BT"})
 
 def infer_gb_nation(country: str | None, postal_code: str | None) -> Tuple[bool, str]:
     """
@@ -30,14 +31,16 @@ def infer_gb_nation(country: str | None, postal_code: str | None) -> Tuple[bool,
     if not postal_code:
         return False, "Unknown"
 
-    prefix2 = pc2.split()[0][:2].upper() if pc2 else ""
-    prefix1 = pc2.split()[0][:1].upper() if pc2 else ""
+    # pc2 is already upper-cased; split out the outward code once
+    outward = pc2.split()[0] if pc2 else ""
+    prefix2 = outward[:2]
+    prefix1 = outward[:1]
 
     if prefix2 in NI_PREFIXES:
         return False, "Northern Ireland"
     if prefix2 in WALES_PREFIXES:
         return True, "Wales"
-    if prefix2 in SCOTLAND_PREFIXES or prefix1 in ("G",):
+    if prefix2 in SCOTLAND_PREFIXES or prefix1 == "G":
         return True, "Scotland"
 
     if UK_POSTCODE_RE.match(pc2):
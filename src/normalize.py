@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 
 _NON_ALNUM = re.compile(r"[^a-z0-9]+", re.I)
 
-LTD_TOKENS = {
+LTD_TOKENS = frozenset({
     "ltd",
     "limited",
     "plc",
@@ -19,31 +20,34 @@ LTD_TOKENS = {
     "(uk)",
     "u",
     "k",
-}
+})
 
-UK_VALUES = {
+UK_VALUES = frozenset({
     "british",
     "uk",
     "united kingdom",
     "england",
     "scotland",
     "wales",
-}
+})
 
 COUNTRY_VARIANTS = {
-    "united states": {"usa", "u.s.a", "united states of america", "us", "u.s"},
-    "united arab emirates": {"uae", "u.a.e"},
-    "south korea": {
+    "united states": frozenset({"usa", "u.s.a", "united states of america", "us", "u.s"}),
+    "united arab emirates": frozenset({"uae", "u.a.e"}),
+    "south korea": frozenset({
         "republic of korea",
         "korea, republic of",
         "korea republic of",
         "korea (republic of)",
         "korea",
-    },
-    "hong kong": {"hong kong sar", "hong kong, china"},
+    }),
+    "hong kong": frozenset({"hong kong sar", "hong kong, china"}),
 }
 
-APPROVED_HUBS_CANON = [
+# Reverse lookup so canon_country is one dict probe instead of a scan
+_VARIANT_TO_CANON = {v: canon for canon, variants in COUNTRY_VARIANTS.items() for v in variants}
+
+APPROVED_HUBS_CANON = frozenset({
     "india",
     "united states",
     "china",
@@ -65,20 +69,36 @@ APPROVED_HUBS_CANON = [
     "israel",
     "taiwan",
     "new zealand",
-]
+})
+
+# Every normalised value foreign_hub_value() accepts — hub names and their
+# variants, minus UK values — so the check is a single probe.
+_FOREIGN_HUB_KEYS = frozenset(
+    t
+    for t in APPROVED_HUBS_CANON | _VARIANT_TO_CANON.keys()
+    if t not in UK_VALUES and _VARIANT_TO_CANON.get(t, t) in APPROVED_HUBS_CANON
+)
 
 
-def norm_text(s: str | None) -> str:
+# Uncached; use it for one-off strings such as company names.
+def norm_name_text(s: str | None) -> str:
     if not s:
         return ""
     s = s.strip().lower()
-    s = _NON_ALNUM.sub(" ", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
+    # _NON_ALNUM already folds every whitespace run into a single space
+    return _NON_ALNUM.sub(" ", s).strip()
+
+
+# Nationality / country / town values repeat across thousands of officers and
+# PSCs, so the same handful of strings would otherwise be re-normalised.
+norm_text = lru_cache(maxsize=8192)(norm_name_text)
 
 
 def norm_company_name(name: str) -> str:
-    t = norm_text(name)
+    # Company names are effectively unique (~100k per sponsor register load),
+    # so they bypass norm_text's cache: every call would miss and evict the
+    # hot country / town entries.
+    t = norm_name_text(name)
     toks = [x for x in t.split() if x and x not in LTD_TOKENS]
     return " ".join(toks)
 
@@ -87,10 +107,7 @@ def canon_country(raw: str | None) -> str:
     t = norm_text(raw)
     if not t:
         return ""
-    for canon, variants in COUNTRY_VARIANTS.items():
-        if t == canon or t in variants:
-            return canon
-    return t
+    return _VARIANT_TO_CANON.get(t, t)
 
 
 def is_uk_value(raw: str | None) -> bool:
@@ -98,12 +115,11 @@ def is_uk_value(raw: str | None) -> bool:
 
 
 def approved_hub(raw: str | None) -> bool:
-    c = canon_country(raw)
-    if not c:
-        return False
-    if c in APPROVED_HUBS_CANON:
-        return True
-    for canon, _variants in COUNTRY_VARIANTS.items():
-        if c == canon and canon in APPROVED_HUBS_CANON:
-            return True
-    return False
+    return canon_country(raw) in APPROVED_HUBS_CANON
+
+
+def foreign_hub_value(raw: str | None) -> bool:
+    """
+    is_uk_value() is False and approved_hub() is True, normalising once.
+    """
+    return norm_text(raw) in _FOREIGN_HUB_KEYS
@@ -1,19 +1,23 @@
 from __future__ import annotations
 
 import os
+import heapq
 import logging
 import random
+import re
 import sys
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta, date
-from typing import Any, Dict, List, Tuple
+from typing import Any, Deque, Dict, Iterator, List, Tuple
 import html
 
 from .config import load_config
 from .companies_house import CHClient
 from .cache_db import LeadCache
 from .sponsor_register import SponsorRegister
-from .normalize import approved_hub, is_uk_value, norm_text
+from .normalize import foreign_hub_value, norm_name_text, norm_text
 from .scoring import Signals, score as score_fn, ALLOWLIST, DENYLIST
 from .geo import infer_gb_nation
 from .emailer import send_html_email
@@ -44,6 +48,9 @@ NAME_EXCLUDE_KEYWORDS = [
     "estate",
 ]
 
+# Same substring semantics as looping over the list, but one regex pass per name
+_NAME_EXCLUDE_RE = re.compile("|".join(re.escape(kw) for kw in NAME_EXCLUDE_KEYWORDS))
+
 
 @dataclass
 class Lead:
@@ -63,19 +70,74 @@ class Lead:
 
 
 def _contains_excluded_name(name: str) -> bool:
-    n = norm_text(name)
-    return any(kw in n for kw in NAME_EXCLUDE_KEYWORDS)
+    # Company names are unique per run: skip norm_text's cache
+    return _NAME_EXCLUDE_RE.search(norm_name_text(name)) is not None
 
 
 def _sic_hits(sic_codes: List[str]) -> Tuple[bool, int]:
-    allow = any(code in ALLOWLIST for code in sic_codes)
+    allow = not ALLOWLIST.isdisjoint(sic_codes)
     deny_hits = sum(1 for code in sic_codes if code in DENYLIST)
     return allow, deny_hits
 
 
-def _company_age_days(inc_date: str) -> int:
-    d = datetime.fromisoformat(inc_date).date()
-    return (date.today() - d).days
+def _company_age_days(inc_date: str, today: date) -> int:
+    # CH dates are plain YYYY-MM-DD; parse straight to a date against the
+    # run's fixed `today` rather than building a datetime and re-reading the
+    # clock per candidate.
+    return (today - date.fromisoformat(inc_date[:10])).days
+
+
+def _search_sic_pages(
+    ch: CHClient,
+    pool: ThreadPoolExecutor,
+    *,
+    sic: str,
+    window_from: str,
+    window_to: str,
+    page_size: int,
+    max_pages: int,
+    window: int,
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Yield advanced-search result pages for one SIC code, in page order.
+    Page 0 reports the total hit count, so the remaining pages are then
+    fetched concurrently on the pool, at most `window` ahead of the
+    consumer; pages not yet started are cancelled when it stops early.
+    """
+    if max_pages <= 0:
+        return
+
+    def fetch(page: int) -> Dict[str, Any]:
+        return ch.advanced_search(
+            incorporated_from=window_from,
+            incorporated_to=window_to,
+            sic_codes=sic,
+            company_status="active",
+            start_index=page * page_size,
+            size=page_size,
+        )
+
+    first = fetch(0)
+    yield first.get("items") or []
+
+    try:
+        n_pages = min(max_pages, -(-int(first["hits"]) // page_size))
+    except (KeyError, TypeError, ValueError):
+        n_pages = max_pages
+
+    pending: Deque[Future] = deque()
+    next_page = 1
+    try:
+        while True:
+            while next_page < n_pages and len(pending) < max(window, 1):
+                pending.append(pool.submit(fetch, next_page))
+                next_page += 1
+            if not pending:
+                break
+            yield pending.popleft().result().get("items") or []
+    finally:
+        for fut in pending:
+            fut.cancel()
 
 
 def _list_all_pscs(ch: CHClient, company_number: str) -> List[Dict[str, Any]]:
@@ -108,16 +170,36 @@ def _list_all_officers(ch: CHClient, company_number: str) -> List[Dict[str, Any]
     return out
 
 
-def _active_directors(officers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    directors = []
+def _active_directors(officers: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Return (natural, corporate) active directors; each role is lower-cased
+    once here so callers never need to re-inspect it.
+    """
+    natural = []
+    corporate = []
     for o in officers:
-        role = (o.get("officer_role") or "").lower()
-        if role not in {"director", "corporate-director"}:
-            continue
         if o.get("resigned_on"):
             continue
-        directors.append(o)
-    return directors
+        role = (o.get("officer_role") or "").lower()
+        if role == "director":
+            natural.append(o)
+        elif role == "corporate-director":
+            corporate.append(o)
+    return natural, corporate
+
+
+_MISSING_VALUES = frozenset({"", "unknown"})
+
+
+def _person_signals(nat: str | None, cor: str | None) -> Tuple[bool, bool]:
+    """
+    Return (missing_both, foreign_hub) for one individual's nationality and
+    country of residence. Either indicator counts for the hub check, so UK
+    nationality + foreign residence counts.
+    """
+    if norm_text(nat) in _MISSING_VALUES and norm_text(cor) in _MISSING_VALUES:
+        return True, False
+    return False, foreign_hub_value(nat) or foreign_hub_value(cor)
 
 
 def _psc_signals(pscs: List[Dict[str, Any]]) -> Tuple[bool, bool, bool, int, List[str]]:
@@ -147,62 +229,43 @@ def _psc_signals(pscs: List[Dict[str, Any]]) -> Tuple[bool, bool, bool, int, Lis
             if "individual" not in psc_types:
                 psc_types.append("individual")
 
-            nat = p.get("nationality")
-            cor = p.get("country_of_residence")
-
-            nat_missing = (not nat) or (norm_text(nat) in {"", "unknown"})
-            cor_missing = (not cor) or (norm_text(cor) in {"", "unknown"})
-            if nat_missing and cor_missing:
+            person_missing, person_hub = _person_signals(p.get("nationality"), p.get("country_of_residence"))
+            if person_missing:
                 missing_any = True
                 continue
-
-            # Either indicator counts; UK nationality + foreign residence counts
-            if (nat and (not is_uk_value(nat)) and approved_hub(nat)) or (
-                cor and (not is_uk_value(cor)) and approved_hub(cor)
-            ):
+            if person_hub:
                 foreign_hub = True
 
     return corporate, foreign_hub, missing_any, active_count, psc_types
 
 
 def _director_signals(
-    ch: CHClient, company_number: str, active_directors: List[Dict[str, Any]]
-) -> Tuple[bool, bool, bool]:
+    ch: CHClient, company_number: str, natural_directors: List[Dict[str, Any]]
+) -> Tuple[bool, bool]:
     """
     Return:
-      corporate_director, foreign_director_hub, missing_fields_seen
+      foreign_director_hub, missing_fields_seen
 
     NOTE: This can be expensive because it may call appointment endpoints.
     """
-    corp = any((d.get("officer_role") or "").lower() == "corporate-director" for d in active_directors)
     foreign_hub = False
     missing = False
 
-    for d in active_directors:
-        if (d.get("officer_role") or "").lower() == "corporate-director":
-            continue
-
+    for d in natural_directors:
         appt_id = d.get("appointment_id")
         if not appt_id:
             continue
 
         detail = ch.officer_appointment(company_number, appt_id)
-        nat = detail.get("nationality")
-        cor = detail.get("country_of_residence")
-
-        nat_missing = (not nat) or (norm_text(nat) in {"", "unknown"})
-        cor_missing = (not cor) or (norm_text(cor) in {"", "unknown"})
-        if nat_missing and cor_missing:
+        person_missing, person_hub = _person_signals(detail.get("nationality"), detail.get("country_of_residence"))
+        if person_missing:
             missing = True
             continue
-
-        if (nat and (not is_uk_value(nat)) and approved_hub(nat)) or (
-            cor and (not is_uk_value(cor)) and approved_hub(cor)
-        ):
+        if person_hub:
             foreign_hub = True
             break
 
-    return corp, foreign_hub, missing
+    return foreign_hub, missing
 
 
 def _mid_size_ok(directors_count: int, psc_count: int, corporate_psc: bool, corporate_director: bool) -> bool:
@@ -210,7 +273,149 @@ def _mid_size_ok(directors_count: int, psc_count: int, corporate_psc: bool, corp
 
 
 def _uk_name_bonus(company_name: str, corporate_psc: bool) -> bool:
-    return (" uk " in f" {norm_text(company_name)} ") and corporate_psc
+    return (" uk " in f" {norm_name_text(company_name)} ") and corporate_psc
+
+
+@dataclass
+class CandidateProfile:
+    company_name: str
+    incorporation_date: str
+    age_days: int
+    town: str
+    country: str
+    sic_codes: List[str]
+
+
+def _profile_gate(ch: CHClient, cn: str, today: date) -> Tuple[str | None, CandidateProfile | None]:
+    """
+    Fetch the company profile and apply the cheap profile-only gates.
+
+    Return:
+      stat_key, profile
+    stat_key names the stats counter to bump (None for silent drops); the
+    profile is only set when the company passed. Runs on worker threads.
+    """
+    profile      = ch.company_profile(cn)
+    company_name = profile.get("company_name") or ""
+    if _contains_excluded_name(company_name):
+        return "name_excluded", None
+
+    inc_date = profile.get("date_of_creation")
+    if not inc_date:
+        return None, None
+
+    age_days = _company_age_days(inc_date, today)
+    if age_days < 0 or age_days > 365:
+        return None, None
+
+    addr     = profile.get("registered_office_address") or {}
+    town     = addr.get("locality") or addr.get("post_town") or ""
+    country  = addr.get("country") or ""
+    postcode = addr.get("postal_code") or ""
+
+    allowed_geo, inferred = infer_gb_nation(country, postcode)
+    if not allowed_geo:
+        return "geo_excluded", None
+
+    sic_codes = [str(x) for x in (profile.get("sic_codes") or []) if str(x).strip()]
+    if not sic_codes:
+        return "sic_missing_excluded", None
+
+    return None, CandidateProfile(
+        company_name=company_name,
+        incorporation_date=inc_date,
+        age_days=age_days,
+        town=town,
+        country=inferred,
+        sic_codes=sic_codes,
+    )
+
+
+def _evaluate_candidate(
+    ch: CHClient, cn: str, prof: CandidateProfile, lic_reason: str
+) -> Tuple[str | None, Lead | None]:
+    """
+    Run the PSC / officer gates for a company that passed _profile_gate and
+    the sponsor check, and score it if it qualifies.
+
+    Return:
+      stat_key, lead
+    Runs on worker threads, so it must not touch the cache or the shared
+    stats dict.
+    """
+    company_name = prof.company_name
+    age_days     = prof.age_days
+    sic_codes    = prof.sic_codes
+
+    # PSC signals (strong, structured)
+    pscs = _list_all_pscs(ch, cn)
+    corporate_psc, foreign_psc_hub, psc_missing_any, psc_count, psc_types = _psc_signals(pscs)
+
+    # Directors (active only)
+    officers  = _list_all_officers(ch, cn)
+    natural_directors, corporate_directors = _active_directors(officers)
+    directors_count = len(natural_directors) + len(corporate_directors)
+
+    corporate_director   = bool(corporate_directors)
+    foreign_director_hub = False
+    director_missing_any = False
+
+    # Only do expensive appointment lookups if PSC didn't already qualify it
+    if not corporate_psc and not foreign_psc_hub:
+        foreign_d, missing_d = _director_signals(ch, cn, natural_directors)
+        foreign_director_hub = foreign_d
+        director_missing_any = missing_d
+
+    # Strict foreign-linked qualification
+    foreign_linked = corporate_psc or foreign_psc_hub or corporate_director or foreign_director_hub
+    if not foreign_linked:
+        return "not_foreign_linked", None
+
+    # Missing data fallback
+    if (psc_missing_any or director_missing_any) and not corporate_psc:
+        return None, None
+
+    # No PSC filings yet => exclude
+    if psc_count == 0 and not corporate_psc:
+        return None, None
+
+    # Mid-size proxy must pass
+    if not _mid_size_ok(directors_count, psc_count, corporate_psc, corporate_director):
+        return None, None
+
+    allow_hit, deny_hits = _sic_hits(sic_codes)
+    uk_bonus = _uk_name_bonus(company_name, corporate_psc)
+
+    sig = Signals(
+        age_days=age_days,
+        corporate_psc=corporate_psc,
+        foreign_psc_hub=foreign_psc_hub,
+        corporate_director=corporate_director,
+        foreign_director_hub=foreign_director_hub,
+        directors_count=directors_count,
+        psc_count=psc_count,
+        uk_in_name_and_corp_psc=uk_bonus,
+        allowlist_hit=allow_hit,
+        denylist_hits=deny_hits,
+    )
+    sc, reasons = score_fn(sig)
+
+    lead = Lead(
+        company_name=company_name,
+        company_number=cn,
+        incorporation_date=prof.incorporation_date,
+        sic_codes=sic_codes,
+        directors_count=directors_count,
+        psc_count=psc_count,
+        psc_types=psc_types,
+        town=prof.town,
+        country=prof.country,
+        ch_url=f"https://find-and-update.company-information.service.gov.uk/company/{cn}",
+        sponsor_status=f"Not found ({lic_reason})",
+        score=sc,
+        reasons=reasons,
+    )
+    return "qualified_scored", lead
 
 
 def build_html_email(leads: List[Lead], run_ts: datetime, window_from: str, window_to: str, stats: Dict[str, int]) -> str:
@@ -273,22 +478,25 @@ def build_html_email(leads: List[Lead], run_ts: datetime, window_from: str, wind
 def main():
     log.info("Starting CW Structured Sponsor Leads Bot")
 
+    cfg = load_config()
+
     # Speed / volume knobs
     # MAX_SEEDED_CANDIDATES is now much higher than MAX_EVAL_CANDIDATES so we
     # actually cover the full SIC allowlist before hitting the eval cap.
-    TARGET_QUALIFIED_POOL = int(os.getenv("TARGET_QUALIFIED_POOL", "120"))
-    MAX_EVAL_CANDIDATES   = int(os.getenv("MAX_EVAL_CANDIDATES",   "600"))
-    MAX_SEEDED_CANDIDATES = int(os.getenv("MAX_SEEDED_CANDIDATES", "2000"))
+    TARGET_QUALIFIED_POOL = cfg.target_qualified_pool
+    MAX_EVAL_CANDIDATES   = cfg.max_eval_candidates
+    MAX_SEEDED_CANDIDATES = cfg.max_seeded_candidates
 
-    cfg = load_config()
     os.makedirs(os.path.dirname(cfg.cache_path), exist_ok=True)
 
-    ch    = CHClient(cfg.companies_house_api_key)
+    ch    = CHClient(cfg.companies_house_api_key, workers=cfg.ch_workers, retries=cfg.ch_retries)
     cache = LeadCache(cfg.cache_path)
 
-    log.info("Loading Sponsor Register...")
-    sponsor = SponsorRegister.load(cfg.sponsor_register_url)
-    log.info("Sponsor Register loaded")
+    # The register download + parse is independent of CH seeding, so it runs
+    # on its own thread and is only waited on before evaluation starts.
+    log.info("Loading Sponsor Register in the background...")
+    sponsor_loader = ThreadPoolExecutor(max_workers=1)
+    sponsor_future = sponsor_loader.submit(SponsorRegister.load, cfg.sponsor_register_url)
 
     today      = date.today()
     window_to  = today.isoformat()
@@ -316,11 +524,14 @@ def main():
     # (pharma/manufacturing) and hit the seed cap before reaching tech    #
     # or fintech.  Same shuffle within a given week for reproducibility.  #
     # ------------------------------------------------------------------ #
-    sic_list = list(ALLOWLIST)
+    sic_list = sorted(ALLOWLIST)          # stable base order: set order varies per process
     random.seed(today.isocalendar()[1])   # ISO week number
     random.shuffle(sic_list)
     random.seed()                          # restore non-determinism for everything else
 
+    # One worker pool for every concurrent CH phase (seeding pages, evaluation)
+    pool = ThreadPoolExecutor(max_workers=cfg.ch_workers)
+
     log.info("Beginning Companies House advanced search (SIC allowlist seeding)...")
     log.info(
         f"Seeding caps: MAX_SEEDED_CANDIDATES={MAX_SEEDED_CANDIDATES} | "
@@ -329,20 +540,25 @@ def main():
     log.info(f"SIC search order this week: {sic_list}")
 
     for sic in sic_list:
+        # Fail fast: a register download/parse error should stop the run
+        # before it spends more rate-limited CH quota on seeding.
+        if sponsor_future.done():
+            sponsor_future.result()
+
         log.info(f"Searching SIC {sic}...")
         sic_before = len(candidates)
 
-        for page in range(cfg.max_pages_per_sic):
-            start_index = page * cfg.advanced_page_size
-            data = ch.advanced_search(
-                incorporated_from=window_from,
-                incorporated_to=window_to,
-                sic_codes=sic,
-                company_status="active",
-                start_index=start_index,
-                size=cfg.advanced_page_size,
-            )
-            items = data.get("items") or []
+        pages = _search_sic_pages(
+            ch,
+            pool,
+            sic=sic,
+            window_from=window_from,
+            window_to=window_to,
+            page_size=cfg.advanced_page_size,
+            max_pages=cfg.max_pages_per_sic,
+            window=cfg.ch_workers,
+        )
+        for items in pages:
             if not items:
                 break
 
@@ -356,6 +572,8 @@ def main():
 
             if len(candidates) >= MAX_SEEDED_CANDIDATES:
                 break
+        # Cancel prefetched pages the loop above stopped short of
+        pages.close()
 
         sic_added = len(candidates) - sic_before
         log.info(f"SIC {sic} done. Added {sic_added} new candidates. Total candidates now {len(candidates)}")
@@ -365,6 +583,11 @@ def main():
             break
 
     log.info(f"Candidate pool size after seeding: {len(candidates)}")
+
+    sponsor = sponsor_future.result()
+    sponsor_loader.shutdown()
+    log.info("Sponsor Register loaded")
+
     log.info("Evaluating candidates...")
 
     leads: List[Lead] = []
@@ -372,7 +595,16 @@ def main():
     # as seen at the end — even if they were rejected.
     newly_seen: List[str] = []
 
-    for cn in list(candidates.keys()):
+    # Cache state for the whole pool in a handful of set-based queries
+    # instead of two point lookups per candidate.
+    already_emailed = cache.emailed_among(candidates)
+    already_seen    = cache.seen_among(candidates)
+
+    def _needs_eval(cn: str) -> bool:
+        """False for candidates the cache rules out (no API calls for those)."""
+        return cn not in already_emailed and cn not in already_seen
+
+    def _tick() -> None:
         stats["candidates_seen"] += 1
 
         # Heartbeat every 25
@@ -383,139 +615,93 @@ def main():
                 f"sponsor_excl={stats['sponsor_excluded']} geo_excl={stats['geo_excluded']}"
             )
 
+    # ------------------------------------------------------------------ #
+    # CH calls are network-bound, so evaluate candidates in small batches  #
+    # on a thread pool sharing one pooled session: profiles first, then   #
+    # one batched sponsor-register match for the survivors, then the      #
+    # PSC / officer lookups. Results are consumed in candidate order and  #
+    # every stat is counted only when a candidate's outcome is applied,   #
+    # so the counters and the early stop behave as a serial loop would;   #
+    # anything evaluated past the stop is discarded (not counted, not      #
+    # marked seen) and will be picked up next week.                       #
+    # ------------------------------------------------------------------ #
+    order      = list(candidates)
+    # The MAX_EVAL_CANDIDATES-th candidate is counted and stops the run, so
+    # at most MAX_EVAL_CANDIDATES - 1 are ever evaluated.
+    eval_cap   = max(MAX_EVAL_CANDIDATES - 1, 0)
+    batch_size = max(cfg.ch_workers, 1) * 4
+    consumed   = 0
+
+    while consumed < len(order) and len(leads) < TARGET_QUALIFIED_POOL:
         # Hard cap on evaluation count
-        if stats["candidates_seen"] >= MAX_EVAL_CANDIDATES:
+        if consumed >= eval_cap:
+            _tick()
             log.info(f"Reached MAX_EVAL_CANDIDATES={MAX_EVAL_CANDIDATES}. Stopping evaluation early.")
             break
 
-        # Already emailed — respect the 180-day cooldown
-        if cache.was_emailed(cn):
-            stats["emailed_excluded"] += 1
-            continue
-
-        # Already evaluated in a previous run — skip without any API calls
-        if cache.was_seen(cn):
-            stats["seen_excluded"] += 1
-            continue
-
-        # From here on we are making API calls — record as seen regardless of outcome
-        newly_seen.append(cn)
-
-        profile      = ch.company_profile(cn)
-        company_name = profile.get("company_name") or ""
-        if _contains_excluded_name(company_name):
-            stats["name_excluded"] += 1
-            continue
-
-        inc_date = profile.get("date_of_creation")
-        if not inc_date:
-            continue
-
-        age_days = _company_age_days(inc_date)
-        if age_days < 0 or age_days > 365:
-            continue
-
-        addr     = profile.get("registered_office_address") or {}
-        town     = addr.get("locality") or addr.get("post_town") or ""
-        country  = addr.get("country") or ""
-        postcode = addr.get("postal_code") or ""
-
-        allowed_geo, inferred = infer_gb_nation(country, postcode)
-        if not allowed_geo:
-            stats["geo_excluded"] += 1
-            continue
-
-        sic_codes = [str(x) for x in (profile.get("sic_codes") or []) if str(x).strip()]
-        if not sic_codes:
-            stats["sic_missing_excluded"] += 1
-            continue
-
-        licensed, lic_reason = sponsor.is_licensed(company_name, town)
-        if licensed:
-            stats["sponsor_excluded"] += 1
-            continue
-
-        # PSC signals (strong, structured)
-        pscs = _list_all_pscs(ch, cn)
-        corporate_psc, foreign_psc_hub, psc_missing_any, psc_count, psc_types = _psc_signals(pscs)
-
-        # Directors (active only)
-        officers  = _list_all_officers(ch, cn)
-        directors = _active_directors(officers)
-        directors_count = len(directors)
-
-        corporate_director   = any((d.get("officer_role") or "").lower() == "corporate-director" for d in directors)
-        foreign_director_hub = False
-        director_missing_any = False
-
-        # Only do expensive appointment lookups if PSC didn't already qualify it
-        if not corporate_psc and not foreign_psc_hub:
-            corp_d, foreign_d, missing_d = _director_signals(ch, cn, directors)
-            corporate_director   = corporate_director or corp_d
-            foreign_director_hub = foreign_d
-            director_missing_any = missing_d
-
-        # Strict foreign-linked qualification
-        foreign_linked = corporate_psc or foreign_psc_hub or corporate_director or foreign_director_hub
-        if not foreign_linked:
-            stats["not_foreign_linked"] += 1
-            continue
-
-        # Missing data fallback
-        if (psc_missing_any or director_missing_any) and not corporate_psc:
-            continue
-
-        # No PSC filings yet => exclude
-        if psc_count == 0 and not corporate_psc:
-            continue
+        # Next run of candidates in order: up to batch_size that need API
+        # calls, never past the remaining evaluation budget.
+        end    = consumed
+        n_eval = 0
+        while end < len(order) and end < eval_cap and n_eval < batch_size:
+            if _needs_eval(order[end]):
+                n_eval += 1
+            end += 1
+        window = order[consumed:end]
+        batch  = [cn for cn in window if _needs_eval(cn)]
+
+        outcomes: Dict[str, Tuple[str | None, Lead | None]] = {}
+        passed: List[Tuple[str, CandidateProfile]] = []
+        for cn, (stat_key, prof) in zip(batch, pool.map(lambda c: _profile_gate(ch, c, today), batch)):
+            if prof is None:
+                outcomes[cn] = (stat_key, None)
+            else:
+                passed.append((cn, prof))
+
+        verdicts = sponsor.is_licensed_many([(p.company_name, p.town) for _cn, p in passed])
+        to_score: List[Tuple[str, CandidateProfile, str]] = []
+        for (cn, prof), (licensed, lic_reason) in zip(passed, verdicts):
+            if licensed:
+                outcomes[cn] = ("sponsor_excluded", None)
+            else:
+                to_score.append((cn, prof, lic_reason))
+
+        scored = pool.map(lambda job: _evaluate_candidate(ch, *job), to_score)
+        for (cn, _prof, _reason), result in zip(to_score, scored):
+            outcomes[cn] = result
+
+        for cn in window:
+            consumed += 1
+            _tick()
+
+            # Already emailed — respect the 180-day cooldown
+            if cn in already_emailed:
+                stats["emailed_excluded"] += 1
+                continue
 
-        # Mid-size proxy must pass
-        if not _mid_size_ok(directors_count, psc_count, corporate_psc, corporate_director):
-            continue
+            # Already evaluated in a previous run — skip without any API calls
+            if cn in already_seen:
+                stats["seen_excluded"] += 1
+                continue
 
-        allow_hit, deny_hits = _sic_hits(sic_codes)
-        uk_bonus = _uk_name_bonus(company_name, corporate_psc)
-
-        sig = Signals(
-            age_days=age_days,
-            corporate_psc=corporate_psc,
-            foreign_psc_hub=foreign_psc_hub,
-            corporate_director=corporate_director,
-            foreign_director_hub=foreign_director_hub,
-            directors_count=directors_count,
-            psc_count=psc_count,
-            uk_in_name_and_corp_psc=uk_bonus,
-            allowlist_hit=allow_hit,
-            denylist_hits=deny_hits,
-        )
-        sc, reasons = score_fn(sig)
-
-        leads.append(
-            Lead(
-                company_name=company_name,
-                company_number=cn,
-                incorporation_date=inc_date,
-                sic_codes=sic_codes,
-                directors_count=directors_count,
-                psc_count=psc_count,
-                psc_types=psc_types,
-                town=town,
-                country=inferred,
-                ch_url=f"https://find-and-update.company-information.service.gov.uk/company/{cn}",
-                sponsor_status=f"Not found ({lic_reason})",
-                score=sc,
-                reasons=reasons,
-            )
-        )
-        stats["qualified_scored"] += 1
+            # API calls were made — record as seen regardless of outcome
+            newly_seen.append(cn)
+            stat_key, lead = outcomes[cn]
+            if stat_key:
+                stats[stat_key] += 1
+            if lead is not None:
+                leads.append(lead)
+
+            # Quality-preserving early stop
+            if len(leads) >= TARGET_QUALIFIED_POOL:
+                log.info(f"Reached TARGET_QUALIFIED_POOL={TARGET_QUALIFIED_POOL}. Stopping evaluation early.")
+                break
 
-        # Quality-preserving early stop
-        if len(leads) >= TARGET_QUALIFIED_POOL:
-            log.info(f"Reached TARGET_QUALIFIED_POOL={TARGET_QUALIFIED_POOL}. Stopping evaluation early.")
-            break
+    pool.shutdown()
 
-    leads.sort(key=lambda x: x.score, reverse=True)
-    selected = leads[: cfg.max_leads]
+    # Only the top max_leads are ever used; nlargest keeps the same order as
+    # a stable descending sort + slice without sorting the whole pool.
+    selected = heapq.nlargest(cfg.max_leads, leads, key=lambda x: x.score)
 
     log.info(f"Scoring complete. Qualified leads: {len(leads)} | Selected: {len(selected)}")
 
@@ -3,16 +3,16 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import List, Tuple
 
-ALLOWLIST = {
+ALLOWLIST = frozenset({
     "58290","62012","62020","62030","62090","63110","63120",
     "21100","21200","72110","72190","46460",
     "25620","26110","26200","26309","26511","26600","27110","27900","28110","28290","28990",
     "46190","46510","46520","46900",
     "64110","64191","64999","66190",
     "86210","86220","86900",
-}
+})
 
-DENYLIST = {
+DENYLIST = frozenset({
     "68100","68209","68320",
     "41100","41201","41202","43310","43320","43330","43390","43999",
     "56101","56103","56302",
@@ -20,7 +20,7 @@ DENYLIST = {
     "81210","81299",
     "47190","47290","47710","47799","47890",
     "82990",
-}
+})
 
 @dataclass
 class Signals:
@@ -1,76 +1,172 @@
 from __future__ import annotations
 
+import codecs
 import csv
 import io
 import re
-from dataclasses import dataclass
-from difflib import SequenceMatcher
-from typing import Dict, List, Tuple
+from dataclasses import dataclass, field
+from typing import IO, Dict, List, Set, Tuple
 
 import requests
+from rapidfuzz import fuzz, process
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .normalize import norm_company_name, norm_text
 
 GOVUK_WORKERS_PUBLICATION = "https://www.gov.uk/government/publications/register-of-licensed-sponsors-workers"
-_ASSET_CSV_RE = re.compile(
-    r"https://assets\.publishing\.service\.gov\.uk/media/[^\"']+Worker_and_Temporary_Worker\.csv"
-)
-
-
-def _discover_latest_workers_csv_url() -> str:
-    html = requests.get(GOVUK_WORKERS_PUBLICATION, timeout=30).text
-    m = _ASSET_CSV_RE.search(html)
-    if m:
-        return m.group(0)
-    any_csv = re.findall(r"https://assets\.publishing\.service\.gov\.uk/media/[^\"']+\.csv", html)
-    for u in any_csv:
-        if "Worker" in u and "Temporary" in u:
-            return u
+# Every asset CSV link on the page; the workers register is picked from these
+_ASSET_CSV_RE = re.compile(r"https://assets\.publishing\.service\.gov\.uk/media/[^\"']+\.csv")
+_WORKERS_CSV_SUFFIX = "Worker_and_Temporary_Worker.csv"
+
+# Register CSV columns, in order of preference (names have varied over time)
+_NAME_COLUMNS = ("Organisation Name", "Sponsor Name", "Sponsor")
+_TOWN_COLUMNS = ("Town/City", "Town", "City")
+
+# Publication page streaming: read size, hard cap, and how much of each
+# buffer is held back in case an asset URL is split across reads.
+_PAGE_CHUNK = 16 * 1024
+_PAGE_MAX_BYTES = 2 * 1024 * 1024
+_LINK_OVERLAP = 512
+
+
+# Fuzzy thresholds: name alone, or name + matching town. They were set for
+# difflib's ratio; fuzz.ratio (2*LCS / total length) never scores lower than
+# that, so pairs just under a threshold (e.g. 0.857 -> 0.905, 0.791 -> 0.884)
+# can now cross it and slightly more companies are excluded as licensed.
+FUZZY_NAME_MIN = 0.92
+FUZZY_NAME_TOWN_MIN = 0.88
+
+# Anything scoring below this can never exclude, so rapidfuzz is given it as a
+# score_cutoff and skips the full comparison for hopeless (most) pairs.
+FUZZY_CUTOFF = min(FUZZY_NAME_MIN, FUZZY_NAME_TOWN_MIN) * 100
+
+# Queries per cdist call: bounds the score matrix to FUZZY_BATCH x register
+# size float32s (~25 MB for a 100k-name register).
+FUZZY_BATCH = 64
+
+
+def build_govuk_session(retries: int = 3) -> requests.Session:
+    """
+    Session for the GOV.UK page + register CSV: both requests share one
+    retry policy, so a transient GOV.UK/CDN error doesn't fail the run.
+    """
+    retry = Retry(
+        total=retries,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    s = requests.Session()
+    s.mount("https://", HTTPAdapter(max_retries=retry))
+    return s
+
+
+def _discover_latest_workers_csv_url(session: requests.Session) -> str:
+    # Stream the page and stop as soon as the canonical link has been seen;
+    # it sits near the top of the attachments list, well before the footer.
+    fallback = None
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    tail = ""
+    read = 0
+    with session.get(GOVUK_WORKERS_PUBLICATION, timeout=30, stream=True) as resp:
+        chunks = resp.iter_content(chunk_size=_PAGE_CHUNK)
+        done = False
+        while not done:
+            chunk = next(chunks, b"")
+            read += len(chunk)
+            done = not chunk or read >= _PAGE_MAX_BYTES
+            text = tail + decoder.decode(chunk, final=done)
+            # A link may straddle two chunks: leave anything that could still
+            # be growing at the end of the buffer for the next pass.
+            safe = len(text) if done else max(len(text) - _LINK_OVERLAP, 0)
+            for m in _ASSET_CSV_RE.finditer(text):
+                if not done and m.end() >= safe:
+                    safe = m.start()
+                    break
+                u = m.group(0)
+                if u.endswith(_WORKERS_CSV_SUFFIX):
+                    return u
+                if fallback is None and "Worker" in u and "Temporary" in u:
+                    fallback = u
+            tail = text[safe:]
+    if fallback:
+        return fallback
     raise RuntimeError(
         "Could not discover Sponsor Register CSV URL from GOV.UK page. Set SPONSOR_REGISTER_URL env var."
     )
 
 
-def _seq_ratio(a: str, b: str) -> float:
-    return SequenceMatcher(None, a, b).ratio()
+def _first_value(row: List[str], cols: List[int]) -> str:
+    """First non-empty cell among cols, in preference order, else ""."""
+    for i in cols:
+        if i < len(row) and row[i]:
+            return row[i]
+    return ""
+
+
+def _read_register(buf: IO[str]) -> Dict[str, List[str]]:
+    """Normalised sponsor name -> normalised towns, from the register CSV."""
+    # Plain csv.reader with column positions resolved once from the header:
+    # DictReader would build (and we would then discard) a dict per row.
+    reader = csv.reader(buf)
+    header = next(reader, [])
+    name_cols = [header.index(c) for c in _NAME_COLUMNS if c in header]
+    town_cols = [header.index(c) for c in _TOWN_COLUMNS if c in header]
+
+    names_to_towns: Dict[str, List[str]] = {}
+    # The register lists an organisation once per licensed route, so the
+    # same raw (name, town) pair repeats; normalise each pair only once.
+    done: Set[Tuple[str, str]] = set()
+    for row in reader:
+        if not row:
+            continue
+        name = _first_value(row, name_cols)
+        town = _first_value(row, town_cols)
+        if (name, town) in done:
+            continue
+        done.add((name, town))
+        nname = norm_company_name(name)
+        if not nname:
+            continue
+        ntown = norm_text(town)
+        towns = names_to_towns.setdefault(nname, [])
+        if ntown and ntown not in towns:
+            towns.append(ntown)
+    return names_to_towns
 
 
 @dataclass
 class SponsorRegister:
     names_to_towns: Dict[str, List[str]]
+    _names: List[str] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Choice list for rapidfuzz, built once instead of per lookup
+        self._names = list(self.names_to_towns)
 
     @classmethod
     def load(cls, direct_url: str | None = None) -> "SponsorRegister":
-        url = direct_url or _discover_latest_workers_csv_url()
-        resp = requests.get(url, timeout=60)
-        if resp.status_code != 200:
-            raise RuntimeError(f"Failed to download sponsor register CSV: {resp.status_code} {url}")
-
-        buf = io.StringIO(resp.content.decode("utf-8", errors="replace"))
-        reader = csv.DictReader(buf)
-
-        names_to_towns: Dict[str, List[str]] = {}
-        for row in reader:
-            name = row.get("Organisation Name") or row.get("Sponsor Name") or row.get("Sponsor") or ""
-            town = row.get("Town/City") or row.get("Town") or row.get("City") or ""
-            nname = norm_company_name(name)
-            if not nname:
-                continue
-            ntown = norm_text(town)
-            names_to_towns.setdefault(nname, [])
-            if ntown and ntown not in names_to_towns[nname]:
-                names_to_towns[nname].append(ntown)
-
-        return cls(names_to_towns=names_to_towns)
-
-    def is_licensed(self, company_name: str, town: str | None) -> Tuple[bool, str]:
-        """
-        Return (is_licensed, reason).
-        Bias: exclude only when confident (avoid false positives).
-        """
-        n = norm_company_name(company_name)
-        t = norm_text(town or "")
-
+        with build_govuk_session() as session:
+            url = direct_url or _discover_latest_workers_csv_url(session)
+
+            # Stream the download straight into the csv reader: rows are parsed
+            # as bytes arrive and neither the raw file nor a decoded copy of it is
+            # ever held in memory whole.
+            with session.get(url, timeout=60, stream=True) as resp:
+                if resp.status_code != 200:
+                    raise RuntimeError(f"Failed to download sponsor register CSV: {resp.status_code} {url}")
+                resp.raw.decode_content = True  # undo any gzip transfer encoding
+                resp.raw.auto_close = False     # TextIOWrapper must see EOF, not a closed file
+                buf = io.TextIOWrapper(resp.raw, encoding="utf-8", errors="replace", newline="")
+                names_to_towns = _read_register(buf)
+
+            return cls(names_to_towns=names_to_towns)
+
+    def _exact_verdict(self, n: str, t: str) -> Tuple[bool, str] | None:
+        """Decide on the normalised name alone; None means "needs fuzzy"."""
         if not n:
             return False, "No company name"
 
@@ -83,20 +179,61 @@ class SponsorRegister:
                 return True, "Exact name + town match"
             return False, "Exact name match but town mismatch/unknown (not confident)"
 
+        return None
+
+    def _fuzzy_verdict(self, t: str, best: float, best_name: str) -> Tuple[bool, str]:
         # Fuzzy match: only exclude at high confidence
-        best = 0.0
-        best_name = ""
-        best_towns: List[str] = []
-        for reg_name, towns in self.names_to_towns.items():
-            r = _seq_ratio(n, reg_name)
-            if r > best:
-                best = r
-                best_name = reg_name
-                best_towns = towns
-
-        if best >= 0.92:
+        best_towns = self.names_to_towns.get(best_name, [])
+        if best >= FUZZY_NAME_MIN:
             return True, f"Fuzzy name match {best:.2f} to sponsor '{best_name}'"
-        if t and best >= 0.88 and (not best_towns or t in best_towns):
+        if t and best >= FUZZY_NAME_TOWN_MIN and (not best_towns or t in best_towns):
             return True, f"Fuzzy name+town match {best:.2f} to sponsor '{best_name}'"
 
+        if not best_name:
+            return False, f"Not found (best fuzzy < {FUZZY_CUTOFF / 100:.2f})"
         return False, f"Not found (best fuzzy {best:.2f})"
+
+    def is_licensed(self, company_name: str, town: str | None) -> Tuple[bool, str]:
+        """
+        Return (is_licensed, reason).
+        Bias: exclude only when confident (avoid false positives).
+        """
+        return self.is_licensed_many([(company_name, town)])[0]
+
+    def is_licensed_many(self, items: List[Tuple[str, str | None]]) -> List[Tuple[bool, str]]:
+        """
+        (is_licensed, reason) for each (company_name, town) pair.
+        Every name that needs a fuzzy lookup is scored against the register
+        in one multi-threaded cdist call per FUZZY_BATCH queries.
+        """
+        out: List[Tuple[bool, str] | None] = []
+        pending: List[Tuple[int, str, str]] = []
+        for i, (company_name, town) in enumerate(items):
+            n = norm_company_name(company_name)
+            t = norm_text(town or "")
+            verdict = self._exact_verdict(n, t)
+            out.append(verdict)
+            if verdict is None:
+                pending.append((i, n, t))
+
+        for start in range(0, len(pending), FUZZY_BATCH):
+            chunk = pending[start : start + FUZZY_BATCH]
+            scores = process.cdist(
+                [n for _i, n, _t in chunk],
+                self._names,
+                scorer=fuzz.ratio,
+                processor=None,
+                score_cutoff=FUZZY_CUTOFF,
+                workers=-1,
+            )
+            for (i, _n, t), row in zip(chunk, scores):
+                best = 0.0
+                best_name = ""
+                # cdist zeroes scores under the cutoff
+                if len(row) and row.max() > 0:
+                    j = int(row.argmax())
+                    best = float(row[j]) / 100.0
+                    best_name = self._names[j]
+                out[i] = self._fuzzy_verdict(t, best, best_name)
+
+        return out  # type: ignore[return-value]